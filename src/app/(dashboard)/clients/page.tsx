@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
@@ -71,9 +71,17 @@ export default function ClientsPage() {
   const { t } = useTranslation();
   const isTenantAdmin = useIsTenantAdmin();
   const isSupervisor = useIsSupervisor();
+  const [searchInput, setSearchInput] = useState("");
   const [search, setSearch] = useState("");
   const [kycFilter, setKycFilter] = useState<string>("all");
   const [assigneeFilter, setAssigneeFilter] = useState<string>("all");
+
+  useEffect(() => {
+    const handler = setTimeout(() => {
+      setSearch(searchInput.trim());
+    }, 400);
+    return () => clearTimeout(handler);
+  }, [searchInput]);
   
   // Get users for assignee filter dropdown
   const { data: usersData } = useUsers({ limit: 100 });
@@ -187,8 +195,8 @@ export default function ClientsPage() {
             <Input
               placeholder={t("clients.searchClients")}
               className="pl-8"
-              value={search}
-              onChange={(e) => setSearch(e.target.value)}
+              value={searchInput}
+              onChange={(e) => setSearchInput(e.target.value)}
             />
           </div>
           {canManage && (